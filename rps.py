@@ -8,33 +8,87 @@ It features a beautiful GUI. Speech recognition allows voice commands like "star
 "proceed," and "reset." Screenshots are saved at game end.
 """
 
+import os  # OS for file operations and inference thread configuration
+
+# Let the CPU inference runtime use several threads; must be set before MediaPipe is imported
+os.environ.setdefault("OMP_NUM_THREADS", str(max(2, (os.cpu_count() or 2) // 2)))
+os.environ.setdefault("TF_NUM_INTEROP_THREADS", "1")
+os.environ.setdefault("TF_NUM_INTRAOP_THREADS", os.environ["OMP_NUM_THREADS"])
+
 import cv2  # OpenCV for webcam capture and image processing
 import mediapipe as mp  # MediaPipe for hand gesture detection
 import numpy as np  # NumPy for numerical operations
 import tkinter as tk  # Tkinter for GUI creation
-from PIL import Image, ImageTk  # Pillow for image handling in Tkinter
 import random  # Random for AI choice generation
 import time  # Time for timestamp generation
 from tkinter import ttk  # Tkinter themed widgets for table display
 import speech_recognition as sr  # Speech recognition library
-import threading  # Threading for non-blocking speech recognition
-import os  # OS for file operations
+import threading  # Threading for background webcam capture and microphone setup
 
-# Initialize MediaPipe Hands for gesture detection
+# Initialize MediaPipe Hands for gesture detection. It runs once per round in play_round;
+# the lite landmark model keeps that single inference cheap.
 mp_hands = mp.solutions.hands
 mp_drawing = mp.solutions.drawing_utils
-hands = mp_hands.Hands(max_num_hands=1, min_detection_confidence=0.8, min_tracking_confidence=0.8)
+hands = mp_hands.Hands(max_num_hands=1, model_complexity=0,
+                       min_detection_confidence=0.7, min_tracking_confidence=0.8)
+
+# Landmark indices of the finger tips and MCP joints (thumb, index, middle, ring, pinky)
+FINGER_TIP_IDS = np.array([4, 8, 12, 16, 20])
+FINGER_MCP_IDS = np.array([2, 5, 9, 13, 17])
+
+# Gesture lookup by extended-finger mask (bit 0 = index, 1 = middle, 2 = ring, 3 = pinky)
+RPS_GESTURES = {0b0000: "Rock", 0b1111: "Paper", 0b0011: "Scissors"}
+GESTURE_TABLES = {
+    "RPS": RPS_GESTURES,
+    "RPSLS": {**RPS_GESTURES, 0b1100: "Lizard", 0b1011: "Spock"}
+}
+
+# Maximum frame width passed to MediaPipe; wider frames are downscaled keeping aspect ratio
+INFERENCE_WIDTH = 320
+
+# Seconds without a new webcam frame before the capture is reported as failed
+FRAME_TIMEOUT = 2.0
+
+# Round results by outcome table value (0 = Tie, 1 = Win, -1 = Lose)
+OUTCOME_NAMES = ("Tie", "Win", "Lose")
+
+# Display size of each image panel
+PANEL_SIZE = (200, 150)
+
+# The four panels are shown side by side as one composite image, with its binary PPM header
+COMPOSITE_SIZE = (4 * PANEL_SIZE[0], PANEL_SIZE[1])
+COMPOSITE_PPM_HEADER = b"P6\n%d %d\n255\n" % COMPOSITE_SIZE
 
 # Initialize Speech Recognizer
 recognizer = sr.Recognizer()
 
 class GameLogic:
     def __init__(self):
-        """Initialize the GameLogic with choices for RPS and RPSLS modes."""
+        """Initialize the GameLogic with choices and outcome tables for RPS and RPSLS modes."""
         self.choices = {
             "RPS": ["Rock", "Paper", "Scissors"],
             "RPSLS": ["Rock", "Paper", "Scissors", "Lizard", "Spock"]
         }
+        victories = {
+            "Rock": ["Scissors", "Lizard"],
+            "Paper": ["Rock", "Spock"],
+            "Scissors": ["Paper", "Lizard"],
+            "Lizard": ["Spock", "Paper"],
+            "Spock": ["Scissors", "Rock"]
+        }
+        # Per mode: choice -> index, and a player x AI outcome table (0 = Tie, 1 = Win, -1 = Lose)
+        self._index = {}
+        self._outcomes = {}
+        for mode, choices in self.choices.items():
+            self._index[mode] = {choice: i for i, choice in enumerate(choices)}
+            table = np.zeros((len(choices), len(choices)), dtype=np.int8)
+            for i, player in enumerate(choices):
+                for j, ai in enumerate(choices):
+                    if ai in victories[player]:
+                        table[i, j] = 1
+                    elif player in victories[ai]:
+                        table[i, j] = -1
+            self._outcomes[mode] = table
 
     def determine_winner(self, player_choice, ai_choice, game_mode="RPS"):
         """
@@ -48,73 +102,44 @@ class GameLogic:
         Returns:
             str: Result ("Win", "Lose", "Tie", or "Invalid gesture").
         """
-        if player_choice not in self.choices[game_mode] or ai_choice not in self.choices[game_mode]:
+        index = self._index[game_mode]
+        i = index.get(player_choice)
+        j = index.get(ai_choice)
+        if i is None or j is None:
             return "Invalid gesture"
-        if player_choice == ai_choice:
-            return "Tie"
-        victories = {
-            "Rock": ["Scissors", "Lizard"],
-            "Paper": ["Rock", "Spock"],
-            "Scissors": ["Paper", "Lizard"],
-            "Lizard": ["Spock", "Paper"],
-            "Spock": ["Scissors", "Rock"]
-        } if game_mode == "RPSLS" else {
-            "Rock": ["Scissors"],
-            "Paper": ["Rock"],
-            "Scissors": ["Paper"]
-        }
-        return "Win" if ai_choice in victories[player_choice] else "Lose"
+        return OUTCOME_NAMES[self._outcomes[game_mode][i, j]]
+
+def landmarks_to_array(landmark_list):
+    """
+    Convert a MediaPipe landmark list to a NumPy array in a single pass.
+
+    Args:
+        landmark_list: NormalizedLandmarkList from MediaPipe.
+
+    Returns:
+        numpy.ndarray: (N, 3) float32 array of x, y, z coordinates.
+    """
+    points = landmark_list.landmark
+    coords = np.fromiter((c for lm in points for c in (lm.x, lm.y, lm.z)),
+                         dtype=np.float32, count=3 * len(points))
+    return coords.reshape(-1, 3)
 
 def detect_gesture(landmarks, game_mode="RPS"):
     """
     Detect hand gestures based on finger positions.
 
     Args:
-        landmarks (list): List of hand landmarks from MediaPipe.
+        landmarks (numpy.ndarray): Hand landmarks as a (21, 3) array of x, y, z coordinates.
         game_mode (str): Game mode (default: "RPS").
 
     Returns:
         str: Detected gesture or None.
     """
-    thumb_tip = landmarks[4]
-    thumb_mcp = landmarks[2]
-    index_tip = landmarks[8]
-    index_mcp = landmarks[5]
-    middle_tip = landmarks[12]
-    middle_mcp = landmarks[9]
-    ring_tip = landmarks[16]
-    ring_mcp = landmarks[13]
-    pinky_tip = landmarks[20]
-    pinky_mcp = landmarks[17]
-
-    def is_finger_extended(tip, mcp, threshold=0.05):
-        return tip.y < mcp.y - threshold
-
-    thumb_extended = is_finger_extended(thumb_tip, thumb_mcp)
-    index_extended = is_finger_extended(index_tip, index_mcp)
-    middle_extended = is_finger_extended(middle_tip, middle_mcp)
-    ring_extended = is_finger_extended(ring_tip, ring_mcp)
-    pinky_extended = is_finger_extended(pinky_tip, pinky_mcp)
-
-    if game_mode == "RPS":
-        if not index_extended and not middle_extended and not ring_extended and not pinky_extended:
-            return "Rock"
-        elif index_extended and middle_extended and ring_extended and pinky_extended:
-            return "Paper"
-        elif index_extended and middle_extended and not ring_extended and not pinky_extended:
-            return "Scissors"
-    elif game_mode == "RPSLS":
-        if not index_extended and not middle_extended and ring_extended and pinky_extended:
-            return "Lizard"
-        elif index_extended and middle_extended and not ring_extended and pinky_extended:
-            return "Spock"
-        elif not index_extended and not middle_extended and not ring_extended and not pinky_extended:
-            return "Rock"
-        elif index_extended and middle_extended and ring_extended and pinky_extended:
-            return "Paper"
-        elif index_extended and middle_extended and not ring_extended and not pinky_extended:
-            return "Scissors"
-    return None
+    ys = landmarks[:, 1]
+    extended = ys[FINGER_TIP_IDS] < ys[FINGER_MCP_IDS] - 0.05  # Finger extended if tip is above MCP
+    mask = int(np.packbits(extended, bitorder="little")[0])  # Bit 0 = thumb ... bit 4 = pinky
+    # The thumb bit is dropped; gestures only depend on the other four fingers
+    return GESTURE_TABLES.get(game_mode, {}).get(mask >> 1)
 
 def visualize_landmarks(frame, landmarks):
     """
@@ -137,26 +162,78 @@ def visualize_landmarks(frame, landmarks):
         return contour_img
     return frame
 
-def process_image(frame):
+def allocate_preview_buffers():
+    """
+    Allocate panel-size output arrays that preview_panels reuses on every call.
+
+    Returns:
+        dict: Preallocated arrays keyed by pipeline stage.
+    """
+    height, width = PANEL_SIZE[1], PANEL_SIZE[0]
+    return {
+        "small": np.empty((height, width, 3), dtype=np.uint8),
+        "flipped": np.empty((height, width, 3), dtype=np.uint8),
+        "webcam": np.empty((height, width, 3), dtype=np.uint8),
+        "grey": np.empty((height, width), dtype=np.uint8),
+        "thresh": np.empty((height, width), dtype=np.uint8),
+        "mask": np.empty((height, width), dtype=np.uint8),
+        "bg_removed": np.empty((height, width, 3), dtype=np.uint8),
+        "grey_rgb": np.empty((height, width, 3), dtype=np.uint8),
+        "thresh_rgb": np.empty((height, width, 3), dtype=np.uint8)
+    }
+
+def process_image(frame, min_area=2000, buffers=None):
     """
     Process frame to isolate hand using greyscale, thresholding, and contours.
 
     Args:
-        frame (numpy.ndarray): Input frame.
+        frame (numpy.ndarray): Panel-size input frame in RGB format.
+        min_area (float): Minimum contour area kept, in pixels of frame (default: 2000).
+        buffers (dict): Optional output arrays from allocate_preview_buffers() (default: None).
 
     Returns:
-        tuple: (grey, thresh, bg_removed).
+        tuple: (grey, thresh, bg_removed); bg_removed is RGB.
     """
-    grey = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-    _, thresh = cv2.threshold(grey, 100, 255, cv2.THRESH_BINARY)
+    buffers = buffers or {}
+    grey = cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY, dst=buffers.get("grey"))
+    _, thresh = cv2.threshold(grey, 100, 255, cv2.THRESH_BINARY, dst=buffers.get("thresh"))
     contours, _ = cv2.findContours(thresh, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-    mask = np.zeros(grey.shape, dtype=np.uint8)
+    mask = buffers.get("mask")
+    if mask is None:
+        mask = np.zeros(grey.shape, dtype=np.uint8)
+    else:
+        mask.fill(0)
     for contour in contours:
-        if cv2.contourArea(contour) > 2000:
+        if cv2.contourArea(contour) > min_area:
             cv2.drawContours(mask, [contour], -1, 255, -1)
-    bg_removed = cv2.bitwise_and(frame, frame, mask=mask)
+    bg_removed = buffers.get("bg_removed")
+    if bg_removed is not None:
+        bg_removed.fill(0)  # Masked-out pixels are not written by bitwise_and
+    bg_removed = cv2.bitwise_and(frame, frame, dst=bg_removed, mask=mask)
     return grey, thresh, bg_removed
 
+def preview_panels(frame, buffers=None):
+    """
+    Build all four preview panels from a raw webcam frame in a single call.
+    The frame is downscaled first, so mirroring and every later stage work on the small image.
+
+    Args:
+        frame (numpy.ndarray): Raw webcam frame in BGR format.
+        buffers (dict): Optional output arrays from allocate_preview_buffers() (default: None).
+
+    Returns:
+        tuple: (webcam, grey, thresh, bg_removed), each a panel-size RGB image.
+    """
+    buffers = buffers or {}
+    # Scale the contour area filter (2000 px at full resolution) to the downscaled image
+    min_area = 2000 * PANEL_SIZE[0] * PANEL_SIZE[1] / (frame.shape[0] * frame.shape[1])
+    small = cv2.resize(frame, PANEL_SIZE, dst=buffers.get("small"), interpolation=cv2.INTER_AREA)
+    flipped = cv2.flip(small, 1, dst=buffers.get("flipped"))
+    webcam = cv2.cvtColor(flipped, cv2.COLOR_BGR2RGB, dst=buffers.get("webcam"))
+    grey, thresh, bg_removed = process_image(webcam, min_area, buffers)
+    return (webcam, cv2.cvtColor(grey, cv2.COLOR_GRAY2RGB, dst=buffers.get("grey_rgb")),
+            cv2.cvtColor(thresh, cv2.COLOR_GRAY2RGB, dst=buffers.get("thresh_rgb")), bg_removed)
+
 class GUIDemo:
     def __init__(self, root):
         """
@@ -174,6 +251,28 @@ class GUIDemo:
         if not self.cap.isOpened():
             print("Error: Could not open webcam.")
             return
+        # Keep only the newest frame in the driver buffer so reads are never stale
+        if not self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1):
+            print("Warning: Could not set webcam buffer size; preview may lag.")
+        # Request MJPG so USB webcams can deliver compressed frames at a higher FPS
+        self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter.fourcc('M', 'J', 'P', 'G'))
+
+        # Refresh the preview at the webcam's own frame rate; queried before the capture
+        # thread starts, since VideoCapture must not be used from two threads at once
+        fps = self.cap.get(cv2.CAP_PROP_FPS)
+        if fps <= 0:
+            fps = 30  # Backend did not report a frame rate
+        self._tick_ms = max(15, int(1000 / fps))
+
+        # Drain the webcam on a dedicated thread into a single-frame slot
+        self._latest_frame = None  # Most recent frame grabbed by the capture thread
+        self._frame_lock = threading.Lock()  # Guards _latest_frame
+        self._frame_id = 0  # Incremented by the capture thread for every new frame
+        self._shown_frame_id = 0  # Frame ID last drawn by show_preview
+        self._last_frame_time = time.monotonic()  # When the capture thread last delivered a frame
+        self._capture_alive = True  # Control capture thread
+        self.capture_thread = threading.Thread(target=self._capture_loop, daemon=True)
+        self.capture_thread.start()
 
         self.game_logic = GameLogic()
         self.game_mode = "RPS"
@@ -184,9 +283,11 @@ class GUIDemo:
         self.game_active = False
         self.round_number = 0
         self.showing_preview = False  # Track preview state
-        self.preview_start_time = None  # Track when preview started
+        self.preview_deadline = None  # Monotonic time at which the preview counts as stable
+        self.preview_ready_text = None  # Message shown once the preview is stable
         self.preview_after_id = None  # Track the after ID for canceling
-        self.listening = True  # Control speech recognition thread
+        self._preview_error_reported = False  # Preview errors are printed only once
+        self._stop_listening = None  # Stops the background speech listener
         self.screenshot_count = 0  # Track screenshot count
         self.save_path = "screenshots"  # Directory for screenshots
         if not os.path.exists(self.save_path):
@@ -210,45 +311,26 @@ class GUIDemo:
         panel_frame = tk.Frame(self.root, bg="#2C3E50")
         panel_frame.pack(pady=10)
 
-        # Webcam Feed
-        webcam_frame = tk.Frame(panel_frame, bg="#2C3E50")
-        webcam_frame.pack(side=tk.LEFT, padx=10)
-        tk.Label(webcam_frame, text="Webcam Feed", font=("Helvetica", 12, "bold"),
-                 fg="#ECF0F1", bg="#2C3E50").pack()
-        self.webcam_label = tk.Label(webcam_frame, bg="#34495E", borderwidth=2, relief="solid")
-        self.webcam_label.pack()
-        tk.Label(webcam_frame, text="Webcam Feed", font=("Helvetica", 10),
-                 fg="#BDC3C7", bg="#2C3E50").pack()
-
-        # Greyscale
-        grey_frame = tk.Frame(panel_frame, bg="#2C3E50")
-        grey_frame.pack(side=tk.LEFT, padx=10)
-        tk.Label(grey_frame, text="Greyscale", font=("Helvetica", 12, "bold"),
-                 fg="#ECF0F1", bg="#2C3E50").pack()
-        self.grey_label = tk.Label(grey_frame, bg="#34495E", borderwidth=2, relief="solid")
-        self.grey_label.pack()
-        tk.Label(grey_frame, text="Greyscale", font=("Helvetica", 10),
-                 fg="#BDC3C7", bg="#2C3E50").pack()
-
-        # Thresholded
-        thresh_frame = tk.Frame(panel_frame, bg="#2C3E50")
-        thresh_frame.pack(side=tk.LEFT, padx=10)
-        tk.Label(thresh_frame, text="Thresholded", font=("Helvetica", 12, "bold"),
-                 fg="#ECF0F1", bg="#2C3E50").pack()
-        self.thresh_label = tk.Label(thresh_frame, bg="#34495E", borderwidth=2, relief="solid")
-        self.thresh_label.pack()
-        tk.Label(thresh_frame, text="Thresholded", font=("Helvetica", 10),
-                 fg="#BDC3C7", bg="#2C3E50").pack()
-
-        # Background Removed
-        bg_frame = tk.Frame(panel_frame, bg="#2C3E50")
-        bg_frame.pack(side=tk.LEFT, padx=10)
-        tk.Label(bg_frame, text="Background Removed", font=("Helvetica", 12, "bold"),
-                 fg="#ECF0F1", bg="#2C3E50").pack()
-        self.bg_label = tk.Label(bg_frame, bg="#34495E", borderwidth=2, relief="solid")
-        self.bg_label.pack()
-        tk.Label(bg_frame, text="Background Removed", font=("Helvetica", 10),
-                 fg="#BDC3C7", bg="#2C3E50").pack()
+        # All four panels are drawn side by side into one composite image, uploaded once per tick.
+        # Each title sits in a panel-wide cell so it lines up with its part of the image.
+        title_row = tk.Frame(panel_frame, bg="#2C3E50")
+        title_row.pack()
+        for title in ("Webcam Feed", "Greyscale", "Thresholded", "Background Removed"):
+            cell = tk.Frame(title_row, width=PANEL_SIZE[0], height=24, bg="#2C3E50")
+            cell.pack_propagate(False)  # Keep the cell at panel width regardless of text length
+            cell.pack(side=tk.LEFT)
+            tk.Label(cell, text=title, font=("Helvetica", 12, "bold"),
+                     fg="#ECF0F1", bg="#2C3E50").pack()
+        self._composite = np.empty((COMPOSITE_SIZE[1], COMPOSITE_SIZE[0], 3), dtype=np.uint8)
+        self._preview_buffers = allocate_preview_buffers()  # Reused by every preview tick
+        # Fixed views for the webcam, greyscale, thresholded and background-removed panels
+        width = PANEL_SIZE[0]
+        self._panel_views = tuple(self._composite[:, i * width:(i + 1) * width] for i in range(4))
+        self.composite_label = tk.Label(panel_frame, bg="#34495E", borderwidth=2, relief="solid")
+        self.composite_label.image = tk.PhotoImage(width=COMPOSITE_SIZE[0], height=COMPOSITE_SIZE[1])
+        self.composite_label.config(image=self.composite_label.image)
+        # Holding the image on the label keeps it from being garbage collected
+        self.composite_label.pack()
 
         # Score and Result Frame
         score_frame = tk.Frame(self.root, bg="#2C3E50")
@@ -319,9 +401,8 @@ class GUIDemo:
         )
         self.reset_button.pack(pady=5)
 
-        # Start the speech recognition thread
-        self.speech_thread = threading.Thread(target=self.listen_for_commands, daemon=True)
-        self.speech_thread.start()
+        # Calibrate and start the speech recognition listener off the Tk thread
+        threading.Thread(target=self.start_listening, daemon=True).start()
 
     def capture_screenshot(self, frame):
         """
@@ -346,38 +427,103 @@ class GUIDemo:
                 text=f"Game Over! {self.result_label.cget('text').split('! ')[1]} Error saving screenshot."
             ))
 
-    def listen_for_commands(self):
-        """Listen for voice commands in a separate thread."""
-        with sr.Microphone() as source:
-            # Adjust for ambient noise
-            recognizer.adjust_for_ambient_noise(source)
+    def _capture_loop(self):
+        """
+        Continuously grab webcam frames in a separate thread, keeping only the latest.
+        The webcam is released here once the loop stops, so it is never released mid-grab.
+        """
+        while self._capture_alive:
+            if not self.cap.grab():
+                time.sleep(0.01)  # Avoid spinning while the webcam is unavailable
+                continue
+            ret, frame = self.cap.retrieve()
+            if ret:
+                with self._frame_lock:
+                    self._latest_frame = frame
+                    self._frame_id += 1
+                    self._last_frame_time = time.monotonic()
+        self.cap.release()
+
+    def capture_stalled(self):
+        """
+        Check whether the webcam has stopped delivering frames.
+
+        Returns:
+            bool: True if no frame arrived within FRAME_TIMEOUT seconds.
+        """
+        with self._frame_lock:
+            last_frame_time = self._last_frame_time
+        return time.monotonic() - last_frame_time > FRAME_TIMEOUT
+
+    def read_latest_frame(self):
+        """
+        Return the most recent frame grabbed by the capture thread.
+
+        Returns:
+            tuple: (ret, frame) in the same form as cv2.VideoCapture.read();
+                ret is False if no frame has arrived yet or the webcam has stalled.
+        """
+        with self._frame_lock:
+            frame = self._latest_frame
+        if frame is None or self.capture_stalled():
+            return False, None
+        return True, frame
+
+    def start_listening(self):
+        """
+        Calibrate the microphone once and listen for voice commands in the background.
+        Runs on a short-lived thread so opening the microphone does not block the GUI.
+        """
+        try:
+            microphone = sr.Microphone()
+            with microphone as source:
+                # Adjust for ambient noise once instead of before every phrase
+                recognizer.adjust_for_ambient_noise(source)
+            self._stop_listening = recognizer.listen_in_background(
+                microphone, self.on_phrase, phrase_time_limit=3
+            )
             print("Speech recognition started. Say 'start', 'proceed', or 'reset'.")
-            while self.listening:
-                try:
-                    audio = recognizer.listen(source, timeout=1, phrase_time_limit=3)
-                    command = recognizer.recognize_google(audio).lower()
-                    print(f"Recognized command: {command}")
-                    # Map commands to actions, executed on the main thread
-                    if "start" in command:
-                        self.root.after(0, self.start_game)
-                    elif "proceed" in command:
-                        self.root.after(0, self.proceed_round)
-                    elif "reset" in command:
-                        self.root.after(0, self.reset_game)
-                    else:
-                        self.root.after(0, lambda: self.result_label.config(text="Command not recognized. Try 'start', 'proceed', or 'reset'."))
-                except sr.WaitTimeoutError:
-                    # Timeout waiting for speech; continue listening
-                    continue
-                except sr.UnknownValueError:
-                    self.root.after(0, lambda: self.result_label.config(text="Could not understand audio. Try again."))
-                except sr.RequestError as e:
-                    self.root.after(0, lambda: self.result_label.config(text=f"Speech recognition error: {e}"))
-                except Exception as e:
-                    print(f"Speech recognition error: {e}")
-                    self.root.after(0, lambda: self.result_label.config(text="Error in speech recognition."))
+        except Exception as e:
+            print(f"Speech recognition unavailable: {e}")
+
+    def on_phrase(self, recognizer, audio):
+        """
+        Recognize a captured phrase; called on the background listener thread.
+
+        Args:
+            recognizer (sr.Recognizer): The recognizer that captured the phrase.
+            audio (sr.AudioData): The captured phrase.
+        """
+        try:
+            command = recognizer.recognize_google(audio).lower()
+            print(f"Recognized command: {command}")
+            # Handle the command on the main thread
+            self.root.after(0, lambda: self.handle_command(command))
+        except sr.UnknownValueError:
+            self.root.after(0, lambda: self.result_label.config(text="Could not understand audio. Try again."))
+        except sr.RequestError as e:
+            message = f"Speech recognition error: {e}"
+            self.root.after(0, lambda: self.result_label.config(text=message))
+        except Exception as e:
+            print(f"Speech recognition error: {e}")
+            self.root.after(0, lambda: self.result_label.config(text="Error in speech recognition."))
+
+    def handle_command(self, command):
+        """
+        Map a recognized voice command to a game action.
+
+        Args:
+            command (str): The recognized command text in lowercase.
+        """
+        if "start" in command:
+            self.start_game()
+        elif "proceed" in command:
+            self.proceed_round()
+        elif "reset" in command:
+            self.reset_game()
+        else:
+            self.result_label.config(text="Command not recognized. Try 'start', 'proceed', or 'reset'.")
 
-    
     def start_game(self):
         """Start the game by initiating panel previews."""
         if self.game_active:
@@ -386,7 +532,7 @@ class GUIDemo:
         self.start_button.pack_forget()  # Hide Start Game button
         self.proceed_button.pack()  # Show Proceed button
         self.result_label.config(text="Panels starting previews...")
-        self.preview_start_time = time.time()
+        self.start_preview_timer()
         self.show_preview() 
 
     def reset_game(self):
@@ -404,7 +550,8 @@ class GUIDemo:
         for item in self.tree.get_children():
             self.tree.delete(item)
         self.showing_preview = False
-        self.preview_start_time = None
+        self.preview_deadline = None
+        self._preview_error_reported = False
         # Cancel any pending preview updates
         if self.preview_after_id is not None:
             self.root.after_cancel(self.preview_after_id)
@@ -417,40 +564,47 @@ class GUIDemo:
 
         Args:
             label (tk.Label): The label to update.
-            img (numpy.ndarray): The image to display.
+            img (numpy.ndarray): The composite-size RGB image to display.
         """
-        try:
-            img = cv2.resize(img, (200, 150))
-            if len(img.shape) == 2:
-                img = cv2.cvtColor(img, cv2.COLOR_GRAY2RGB)
-            img = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-            img_pil = Image.fromarray(img)
-            photo = ImageTk.PhotoImage(img_pil)
-            label.config(image=photo)
-            label.image = photo
-        except Exception as e:
-            print(f"Error updating image: {e}")
+        # Prepend a binary PPM header so Tk decodes the raw RGB bytes directly
+        # into the label's existing image
+        label.image.configure(data=COMPOSITE_PPM_HEADER + img.tobytes(), format="PPM")
+
+    def start_preview_timer(self):
+        """Start the 1 second stability wait before the preview is reported as active."""
+        self._preview_error_reported = False  # Report errors again for each new preview
+        self.preview_deadline = time.monotonic() + 1.0
+        self.preview_ready_text = f"Panels active. Say 'proceed' or click 'Proceed to Round {self.round_number + 1}'..."
 
     def show_preview(self):
         """Display live preview on panels until Proceed button is clicked."""
         if not self.game_active:
             return
-        ret, frame = self.cap.read()
-        if not ret:
-            print("Error: Could not read frame.")
-            self.result_label.config(text="Error: Could not read frame. Restart the game.")
-            return
-        frame = cv2.flip(frame, 1)
-        grey, thresh, bg_removed = process_image(frame)
-        self.update_image(self.webcam_label, frame)
-        self.update_image(self.grey_label, grey)
-        self.update_image(self.thresh_label, thresh)
-        self.update_image(self.bg_label, bg_removed)
-        if not self.showing_preview and time.time() - self.preview_start_time > 1.0:  # Wait 1 second for stability
-            self.result_label.config(text=f"Panels active. Say 'proceed' or click 'Proceed to Round {self.round_number + 1}'...")
+        # Only repaint the panels when the capture thread has delivered a new frame
+        if self._frame_id != self._shown_frame_id or self.capture_stalled():
+            self._shown_frame_id = self._frame_id
+            ret, frame = self.read_latest_frame()
+            if not ret:
+                print("Error: Could not read frame.")
+                self.result_label.config(text="Error: Could not read frame. Restart the game.")
+                return
+            try:
+                for view, panel in zip(self._panel_views, preview_panels(frame, self._preview_buffers)):
+                    view[...] = panel
+                self.update_image(self.composite_label, self._composite)
+            except Exception as e:
+                # Report the first failure of this preview only; keep the preview loop running
+                if not self._preview_error_reported:
+                    print(f"Error updating image: {e}")
+                    self.result_label.config(text="Error updating panels. Say 'reset' to restart.")
+                    self._preview_error_reported = True
+        # Keep a reported panel error visible instead of replacing it with the ready message
+        if (not self.showing_preview and not self._preview_error_reported
+                and time.monotonic() >= self.preview_deadline):
+            self.result_label.config(text=self.preview_ready_text)
             self.showing_preview = True
-        # Schedule the next preview update with a longer interval
-        self.preview_after_id = self.root.after(50, self.show_preview)
+        # Schedule the next preview update at the webcam frame interval
+        self.preview_after_id = self.root.after(self._tick_ms, self.show_preview)
 
     def proceed_round(self):
         """Proceed to the current round after button click or voice command."""
@@ -465,20 +619,24 @@ class GUIDemo:
     def play_round(self):
         """Process a single round after Proceed button is clicked or voice command."""
         print("Starting round processing...")
-        ret, frame = self.cap.read()
+        ret, frame = self.read_latest_frame()
         if not ret:
             print("Error: Failed to read frame from webcam.")
             self.result_label.config(text="Error: Webcam frame not available. Restart the game.")
             return
         frame = cv2.flip(frame, 1)
-        grey, thresh, bg_removed = process_image(frame)
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = hands.process(frame_rgb)
+        # Landmarks are normalized, so MediaPipe can run on a downscaled copy of the frame
+        height, width = frame.shape[:2]
+        small = frame
+        if width > INFERENCE_WIDTH:
+            small = cv2.resize(frame, (INFERENCE_WIDTH, round(height * INFERENCE_WIDTH / width)),
+                               interpolation=cv2.INTER_AREA)
+        results = hands.process(cv2.cvtColor(small, cv2.COLOR_BGR2RGB))
         if results.multi_hand_landmarks:
             print("Hand landmarks detected.")
             for hand_landmarks in results.multi_hand_landmarks:
                 frame = visualize_landmarks(frame, hand_landmarks)
-                gesture = detect_gesture(hand_landmarks.landmark, self.game_mode)
+                gesture = detect_gesture(landmarks_to_array(hand_landmarks), self.game_mode)
                 if gesture:
                     print(f"Detected gesture: {gesture}")
                     ai_choice = random.choice(self.game_logic.choices[self.game_mode])
@@ -514,7 +672,7 @@ class GUIDemo:
                     else:
                         self.result_label.config(text=f"Round {self.round_number} complete! Panels restarting...")
                         self.showing_preview = False
-                        self.preview_start_time = time.time()
+                        self.start_preview_timer()
                         self.proceed_button.config(text=f"Proceed to Round {self.round_number + 1}")
                         # Add a small delay to allow GUI to refresh
                         self.root.after(100, self.show_preview)
@@ -540,10 +698,12 @@ class GUIDemo:
 
     def cleanup(self):
         """Clean up resources when closing the application."""
-        self.listening = False  # Stop the speech recognition thread
+        if self._stop_listening is not None:
+            self._stop_listening(wait_for_stop=False)  # Stop the background speech listener
         if self.preview_after_id is not None:
             self.root.after_cancel(self.preview_after_id)
-        self.cap.release()
+        self._capture_alive = False  # The capture thread releases the webcam when it stops
+        self.capture_thread.join(timeout=1.0)
 
 # Main execution
 if __name__ == "__main__":